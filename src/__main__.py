@@ -1,15 +1,24 @@
-from contextlib import asynccontextmanager
+import asyncio
+import sys
+from contextlib import asynccontextmanager, suppress
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
 from motor.motor_asyncio import AsyncIOMotorClient
 from src.core.server import run_api_uvicorn
 from src.core.settings import load_settings, Settings
 from src.api.routers import setup_routers
+from src.api.responses import ORJSONResponse
 from src.core.logger import logger
 from src.api.dependencies import setup_dependencies
 from src.common.cache import RedisCache
 from fastapi import FastAPI
-from src.core.gunicorn import run_api_gunicorn
+
+
+async def prefetch_user_configs(app: FastAPI) -> None:
+    try:
+        warmed = await app.state.user_service.prefetch_user_configs()
+        logger.info(f"Prefetched {warmed} user configs into Redis")
+    except Exception as e:
+        logger.warning(f"User config prefetch failed: {e}")
 
 
 def main():
@@ -24,8 +33,10 @@ def main():
             username=settings.db.username,
             password=settings.db.password,
             authSource="admin",
-            maxPoolSize=20,
-            minPoolSize=5,
+            maxPoolSize=settings.db.connection_pool_size,
+            minPoolSize=settings.db.min_pool_size,
+            waitQueueTimeoutMS=settings.db.wait_queue_timeout_ms,
+            maxConnecting=settings.db.max_connecting,
             maxIdleTimeMS=60000,
             serverSelectionTimeoutMS=5000,
             appname="fastapi_mongo_example"
@@ -39,7 +50,10 @@ def main():
             host=settings.redis.host,
             port=settings.redis.port,
             password=settings.redis.password,
-            max_connections=50
+            max_connections=50,
+            # User configs rarely change; a change made by another worker
+            # shows up here within local_cache_ttl (30 s)
+            local_cache_size=10_000,
         )
         await redis_cache.connect()
         app.state.redis_cache = redis_cache
@@ -47,20 +61,43 @@ def main():
         
         # Setup dependencies (needs mongo_db and redis_cache)
         setup_dependencies(app, settings)
-        
+
+        # Idempotent: only builds indexes that don't exist yet. Existing data
+        # may violate a unique index (e.g. duplicate client_ids written before
+        # it existed); the app still starts, without that index.
+        try:
+            await app.state.user_repo.ensure_indexes()
+        except Exception as e:
+            logger.error(f"Index creation failed, fix the data and restart: {e}")
+
+        # Warm the cache in the background: requests are served meanwhile
+        # and a miss just falls through to Mongo
+        prefetch_task = None
+        if settings.redis.prefetch_on_startup:
+            prefetch_task = asyncio.create_task(prefetch_user_configs(app))
+
         try:
             yield
         finally:
             # Cleanup resources
             logger.info("Shutting down... Closing connections")
+            if prefetch_task is not None:
+                prefetch_task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await prefetch_task
             await redis_cache.close()
             logger.info("Redis connection closed")
             mongo_client.close()
             logger.info("MongoDB connection closed")
+            # Only close S3 clients if something actually used them; importing
+            # aioboto3 here just to close nothing costs startup time
+            minio = sys.modules.get("src.services.minio")
+            if minio is not None:
+                await minio.close_s3()
     
     app = FastAPI(
         lifespan=lifespan,
-        default_response_class=JSONResponse,
+        default_response_class=ORJSONResponse,
         docs_url="/docs",
         redoc_url=None,
         swagger_ui_oauth2_redirect_url=None,
@@ -75,8 +112,12 @@ def main():
         allow_methods=["*"],
         allow_headers=["*"]
     )
-    run_api_uvicorn(app, settings)
-    #run_api_gunicorn(app, settings)
+    if settings.server.runtime == "gunicorn":
+        # Imported lazily: gunicorn is only needed for this runtime
+        from src.core.gunicorn import run_api_gunicorn
+        run_api_gunicorn(app, settings)
+    else:
+        run_api_uvicorn(app, settings)
 
 
 if __name__ == "__main__":
@@ -1,5 +1,5 @@
-from fastapi import FastAPI, Request
-from typing import Type, TypeVar
+from fastapi import FastAPI
+from typing import Optional, Type, TypeVar
 from collections.abc import Callable
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from src.services import Service, UserService
@@ -11,6 +11,11 @@ from src.core.settings import Settings
 
 DependencyType = TypeVar("DependencyType")
 
+# Bound once by setup_dependencies() after lifespan startup, so request-time
+# dependencies don't go through app.state lookups
+_mongo_db: Optional[AsyncIOMotorDatabase] = None
+_redis_cache: Optional[RedisCache] = None
+
 
 def singleton(value: DependencyType) -> Callable[[], DependencyType]:
     """
@@ -41,9 +46,9 @@ def build_service(
     return service(repo())
 
 
-def get_mongo_db(request: Request) -> AsyncIOMotorDatabase:
+async def get_mongo_db() -> AsyncIOMotorDatabase:
     """
-    Dependency to get MongoDB database from app state.
+    Dependency to get MongoDB database bound at startup.
     
     Usage in endpoint:
         @app.get("/endpoint")
@@ -51,12 +56,12 @@ def get_mongo_db(request: Request) -> AsyncIOMotorDatabase:
             collection = db["my_collection"]
             ...
     """
-    return request.app.state.mongo_db
+    return _mongo_db
 
 
-def get_redis_cache(request: Request) -> RedisCache:
+async def get_redis_cache() -> RedisCache:
     """
-    Dependency to get Redis cache from app state.
+    Dependency to get Redis cache bound at startup.
     
     Usage in endpoint:
         @app.get("/endpoint")
@@ -64,7 +69,7 @@ def get_redis_cache(request: Request) -> RedisCache:
             await cache.set("key", "value", ttl=3600)
             ...
     """
-    return request.app.state.redis_cache
+    return _redis_cache
 
 
 def setup_dependencies(app: FastAPI, settings: Settings) -> None:
@@ -73,6 +78,16 @@ def setup_dependencies(app: FastAPI, settings: Settings) -> None:
     
     Note: MongoDB and Redis are initialized in lifespan (see __main__.py)
     """
-    # UserService uses MongoDB from app.state.mongo_db
-    app.dependency_overrides[UserService] = lambda: UserService(app.state.mongo_db)
+    global _mongo_db, _redis_cache
+    _mongo_db = app.state.mongo_db
+    _redis_cache = app.state.redis_cache
+
+    # Built on every startup, so a restarted app never keeps a repository
+    # bound to a closed Motor client
+    user_repo = UserRepository(_mongo_db)
+    app.state.user_repo = user_repo
+    # One shared UserService instance, so concurrent requests coalesce their lookups.
+    user_service = UserService(user_repo, _redis_cache)
+    app.state.user_service = user_service
+    app.dependency_overrides[UserService] = singleton(user_service)
 
@@ -1,9 +1,12 @@
 from typing import Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class UserDTO(BaseModel):
+    # strict: no type coercion attempts; frozen: immutable and hashable
+    model_config = ConfigDict(strict=True, extra="forbid", frozen=True)
+
     client_id: str = ""
     crm_url: str = ""
     crm_api_key: str = ""
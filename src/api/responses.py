@@ -0,0 +1,15 @@
+from typing import Any
+
+from fastapi.responses import ORJSONResponse as _ORJSONResponse
+
+from src.common.serializers import dumps
+
+
+class ORJSONResponse(_ORJSONResponse):
+    """
+    ORJSONResponse that encodes with the project serializer, so ObjectId and
+    pydantic models in the content are converted in the same single pass.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -1,7 +1,7 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from src.database.models import UserConfig
 from typing import Annotated
-from src.services.user import UserService
+from src.services.user import UserAlreadyExistsError, UserService
 from src.api.providers import Stub
 from pydantic import BaseModel
 from src.api.dto import UserDTO
@@ -9,23 +9,41 @@ from src.api.dto import UserDTO
 
 user_router = APIRouter(prefix="/user", tags=["User"])
 
+UserServiceDep = Annotated[UserService, Depends(Stub(UserService))]
+
 class UserBody(BaseModel):
     client_id:str
 
 
-@user_router.get("/{client_id}", response_model=UserConfig, status_code=status.HTTP_200_OK)
+@user_router.get(
+    "/{client_id}",
+    response_class=Response,
+    responses={status.HTTP_200_OK: {"model": UserConfig}},
+    status_code=status.HTTP_200_OK,
+)
 async def get_user(
         client_id: str,
-        service: Annotated[UserService, Depends(Stub(UserService))],
-) -> UserConfig:
-    user = await service.get_user(client_id)
-    return user
+        service: UserServiceDep,
+) -> Response:
+    # Body comes pre-encoded from the cache, skip response_model re-serialization
+    body = await service.get_user_wire(client_id)
+    if body is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+    return Response(content=body, media_type="application/json")
 
 
-@user_router.post("/create", response_model=UserConfig, status_code=status.HTTP_200_OK)
+@user_router.post(
+    "/create",
+    response_model=UserConfig,
+    status_code=status.HTTP_200_OK,
+    responses={status.HTTP_409_CONFLICT: {"description": "User already exists"}},
+)
 async def create_user(
         body: UserDTO,
-        service: Annotated[UserService, Depends(Stub(UserService))],
+        service: UserServiceDep,
 ) -> UserConfig:
-    new_user = await service.create(body)
+    try:
+        new_user = await service.create(body)
+    except UserAlreadyExistsError:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="User already exists")
     return new_user
\ No newline at end of file
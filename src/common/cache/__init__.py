@@ -1,3 +1,4 @@
 from .redis import RedisCache
+from .singleflight import SingleFlight
 
-__all__ = ["RedisCache"]
+__all__ = ["RedisCache", "SingleFlight"]
@@ -7,15 +7,53 @@ Features:
 - Automatic JSON serialization with orjson
 - TTL (time-to-live) support
 - Batch operations
+- In-process L1 cache in front of Redis for hot keys
+- Request coalescing for concurrent misses on the same key
 - Context manager support
 """
 
-from typing import Any, Optional, List, Dict
+import socket
+import time
+from typing import Any, Optional, List, Dict, Tuple
+from cachetools import TLRUCache
 import redis.asyncio as redis
-from src.common.serializers import OrjsonSerializer
+from redis.utils import HIREDIS_AVAILABLE
+from redis.exceptions import NoScriptError
+from src.common.cache.singleflight import SingleFlight
+from src.common.serializers import dumps, loads
 from src.core.logger import logger
 
 
+# SET ... PX for every key in a single round trip.
+# KEYS = cache keys, ARGV[1] = ttl in milliseconds, ARGV[2..] = serialized values
+LUA_MSET_EXPIRE = (
+    "for i=1,#KEYS do redis.call('SET', KEYS[i], ARGV[i+1], 'PX', ARGV[1]) end"
+)
+
+# clear_pattern tuning: keys fetched per SCAN call / keys per UNLINK command
+SCAN_COUNT = 1000
+UNLINK_BATCH_SIZE = 500
+
+# Pool re-checks a connection idle for longer than this before reusing it
+HEALTH_CHECK_INTERVAL = 30
+# ping() answers from the last successful round trip if it is this recent
+PING_CACHE_SECONDS = 5.0
+
+# Probe idle pooled connections so NAT/LB middleboxes don't silently drop them
+SOCKET_KEEPALIVE_OPTIONS: Dict[int, int] = (
+    {socket.TCP_KEEPIDLE: 60} if hasattr(socket, "TCP_KEEPIDLE") else {}
+)
+
+
+# L1 key prefix for get_raw() entries, so get() and get_raw() never share one
+RAW_L1_TAG = "raw"
+
+
+def _l1_ttu(_key: Any, entry: tuple, _now: float) -> float:
+    """L1 entries are stored as (value, expires_at), expiry is precomputed."""
+    return entry[1]
+
+
 class RedisCache:
     """
     Async Redis cache with automatic JSON serialization.
@@ -36,6 +74,8 @@ class RedisCache:
         db: int = 0,
         max_connections: int = 50,
         decode_responses: bool = False,
+        local_cache_size: int = 0,
+        local_cache_ttl: float = 30,
     ):
         """
         Initialize Redis cache.
@@ -47,6 +87,12 @@ class RedisCache:
             db: Redis database number (0-15)
             max_connections: Maximum connections in the pool
             decode_responses: If True, responses are decoded to strings
+            local_cache_size: Max number of keys kept in the in-process L1 cache
+                (0 = disabled). Invalidation is local to this process: a delete
+                or set elsewhere stays invisible here for up to local_cache_ttl,
+                so only enable it for data that may be briefly stale.
+            local_cache_ttl: Max seconds a key lives in the L1 cache. This bounds
+                how stale a value can get when another process changes it.
         """
         self.host = host
         self.port = port
@@ -54,9 +100,43 @@ class RedisCache:
         self.db = db
         self.max_connections = max_connections
         self.decode_responses = decode_responses
-        self.serializer = OrjsonSerializer()
+        # Plain function references: one C call per value on the hot path
+        self._loads = loads
+        self._dumps = dumps
         self._pool: Optional[redis.ConnectionPool] = None
         self._client: Optional[redis.Redis] = None
+        self._mset_expire_sha: Optional[str] = None
+        self._l1_ttl = local_cache_ttl
+        self._l1: TLRUCache = TLRUCache(maxsize=local_cache_size, ttu=_l1_ttu)
+        self._l1_hits = 0
+        self._l1_misses = 0
+        self._inflight = SingleFlight()
+        self._last_ping_ok = 0.0
+
+    @property
+    def l1_hit_ratio(self) -> float:
+        """Share of get() calls served from the in-process L1 cache."""
+        total = self._l1_hits + self._l1_misses
+        return self._l1_hits / total if total else 0.0
+
+    def _l1_put(self, key: str, value: Any, pttl: int) -> None:
+        """Store value in the L1 cache, never past its Redis expiry (pttl in ms)."""
+        if not self._l1.maxsize:
+            return
+        ttl = self._l1_ttl if pttl < 0 else min(self._l1_ttl, pttl / 1000)
+        self._l1[key] = (value, time.monotonic() + ttl)
+
+    def _l1_invalidate(self, key: str) -> None:
+        """Drop both the decoded and the raw L1 entry for key."""
+        self._l1.pop(key, None)
+        self._l1.pop((RAW_L1_TAG, key), None)
+
+    async def _get_with_pttl(self, key: str) -> List[Any]:
+        """GET + PTTL in a single round trip."""
+        async with self._client.pipeline(transaction=False) as pipe:
+            pipe.get(key)
+            pipe.pttl(key)
+            return await pipe.execute()
 
     async def connect(self) -> None:
         """
@@ -73,12 +153,21 @@ class RedisCache:
                 db=self.db,
                 max_connections=self.max_connections,
                 decode_responses=self.decode_responses,
+                socket_keepalive=True,
+                socket_keepalive_options=SOCKET_KEEPALIVE_OPTIONS,
+                health_check_interval=HEALTH_CHECK_INTERVAL,
             )
             self._client = redis.Redis(connection_pool=self._pool)
             
             # Test connection
             await self._client.ping()
+            self._last_ping_ok = time.monotonic()
+            # Preload batch scripts so the hot path only sends EVALSHA
+            self._mset_expire_sha = await self._client.script_load(LUA_MSET_EXPIRE)
             logger.info(f"Redis connected: {self.host}:{self.port} (db={self.db})")
+            if not HIREDIS_AVAILABLE:
+                # redis-py picks the hiredis parser automatically when installed
+                logger.warning("hiredis is not installed, using the pure-Python RESP parser")
         except Exception as e:
             logger.error(f"Failed to connect to Redis: {e}")
             raise
@@ -108,6 +197,10 @@ class RedisCache:
     async def get(self, key: str) -> Optional[Any]:
         """
         Get value from cache and deserialize.
+
+        Hot keys are served from the in-process L1 cache without a network
+        round trip, and concurrent misses on the same key share a single
+        Redis GET. The returned object may be shared - don't mutate it.
         
         Args:
             key: Cache key
@@ -118,16 +211,82 @@ class RedisCache:
         Example:
             >>> value = await cache.get("user:123")
         """
+        entry = self._l1.get(key)
+        if entry is not None:
+            self._l1_hits += 1
+            return entry[0]
+        self._l1_misses += 1
+
         self._ensure_connected()
+        return await self._inflight.do(key, lambda: self._fetch(key))
+
+    async def get_raw(self, key: str) -> Optional[bytes]:
+        """
+        Get the stored bytes as-is, without deserialization.
+
+        Useful for values that are already in their final wire format
+        (e.g. pre-encoded JSON responses). Raw values have their own L1
+        entries, so get() never returns bytes cached here.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Raw bytes or None if key doesn't exist
+
+        Example:
+            >>> body = await cache.get_raw("user_wire:123")
+        """
+        entry = self._l1.get((RAW_L1_TAG, key))
+        if entry is not None:
+            self._l1_hits += 1
+            return entry[0]
+        self._l1_misses += 1
+
+        self._ensure_connected()
+        return await self._inflight.do((RAW_L1_TAG, key), lambda: self._fetch(key, raw=True))
+
+    async def _fetch(self, key: str, raw: bool = False) -> Optional[Any]:
+        """Read key from Redis and populate the L1 cache."""
         try:
-            data = await self._client.get(key)
+            data, pttl = await self._get_with_pttl(key)
             if data is None:
                 return None
-            return self.serializer.loads(data)
+            value = data if raw else self._loads(data)
+            self._l1_put((RAW_L1_TAG, key) if raw else key, value, pttl)
+            return value
         except Exception as e:
             logger.error(f"Redis GET error for key '{key}': {e}")
             return None
 
+    async def get_with_ttl(self, key: str) -> Tuple[Optional[Any], int]:
+        """
+        Get value and its remaining time-to-live in one round trip.
+
+        Always reads from Redis (the L1 cache can't report an accurate TTL).
+
+        Args:
+            key: Cache key
+
+        Returns:
+            (value, ttl in milliseconds); ttl is -1 if the key has no expiration,
+            (None, -2) if the key doesn't exist
+
+        Example:
+            >>> value, ttl_ms = await cache.get_with_ttl("user:123")
+        """
+        self._ensure_connected()
+        try:
+            data, pttl = await self._get_with_pttl(key)
+            if data is None:
+                return None, -2
+            value = self._loads(data)
+            self._l1_put(key, value, pttl)
+            return value, pttl
+        except Exception as e:
+            logger.error(f"Redis GET error for key '{key}': {e}")
+            return None, -2
+
     async def set(
         self,
         key: str,
@@ -150,11 +309,44 @@ class RedisCache:
         """
         self._ensure_connected()
         try:
-            data = self.serializer.dumps(value)
+            data = self._dumps(value)
             if ttl:
                 await self._client.setex(key, ttl, data)
             else:
                 await self._client.set(key, data)
+            self._l1_invalidate(key)
+            return True
+        except Exception as e:
+            logger.error(f"Redis SET error for key '{key}': {e}")
+            return False
+
+    async def set_raw(
+        self,
+        key: str,
+        data: bytes,
+        ttl: Optional[int] = None,
+    ) -> bool:
+        """
+        Store bytes as-is, without serialization (counterpart of get_raw).
+
+        Args:
+            key: Cache key
+            data: Bytes to store
+            ttl: Time-to-live in seconds (None = no expiration)
+
+        Returns:
+            True if successful, False otherwise
+
+        Example:
+            >>> await cache.set_raw("user_wire:123", b'{"name":"John"}', ttl=3600)
+        """
+        self._ensure_connected()
+        try:
+            if ttl:
+                await self._client.setex(key, ttl, data)
+            else:
+                await self._client.set(key, data)
+            self._l1_invalidate(key)
             return True
         except Exception as e:
             logger.error(f"Redis SET error for key '{key}': {e}")
@@ -176,6 +368,7 @@ class RedisCache:
         self._ensure_connected()
         try:
             result = await self._client.delete(key)
+            self._l1_invalidate(key)
             return result > 0
         except Exception as e:
             logger.error(f"Redis DELETE error for key '{key}': {e}")
@@ -218,6 +411,7 @@ class RedisCache:
             >>> await cache.expire("user:123", 3600)
         """
         self._ensure_connected()
+        self._l1_invalidate(key)
         try:
             result = await self._client.expire(key, ttl)
             return result
@@ -244,12 +438,12 @@ class RedisCache:
             return {}
 
         try:
-            values = await self._client.mget(keys)
-            result = {}
-            for key, value in zip(keys, values):
-                if value is not None:
-                    result[key] = self.serializer.loads(value)
-            return result
+            _loads = self._loads
+            return {
+                k: _loads(v)
+                for k, v in zip(keys, await self._client.mget(keys))
+                if v is not None
+            }
         except Exception as e:
             logger.error(f"Redis MGET error: {e}")
             return {}
@@ -279,15 +473,26 @@ class RedisCache:
         if not data:
             return True
 
+        for key in data:
+            self._l1_invalidate(key)
         try:
-            serialized = {k: self.serializer.dumps(v) for k, v in data.items()}
+            _dumps = self._dumps
+            serialized = {k: _dumps(v) for k, v in data.items()}
             
             if ttl:
-                # Use pipeline for TTL
-                async with self._client.pipeline() as pipe:
-                    for key, value in serialized.items():
-                        pipe.setex(key, ttl, value)
-                    await pipe.execute()
+                # Single EVALSHA instead of N SETEX commands
+                keys = list(serialized)
+                args = [ttl * 1000, *serialized.values()]
+                try:
+                    await self._client.evalsha(
+                        self._mset_expire_sha, len(keys), *keys, *args
+                    )
+                except NoScriptError:
+                    # Script cache was flushed (e.g. server restart) - reload once
+                    self._mset_expire_sha = await self._client.script_load(LUA_MSET_EXPIRE)
+                    await self._client.evalsha(
+                        self._mset_expire_sha, len(keys), *keys, *args
+                    )
             else:
                 await self._client.mset(serialized)
             return True
@@ -313,6 +518,8 @@ class RedisCache:
         if not keys:
             return 0
 
+        for key in keys:
+            self._l1_invalidate(key)
         try:
             result = await self._client.delete(*keys)
             return result
@@ -330,6 +537,9 @@ class RedisCache:
         Returns:
             Number of keys deleted
             
+        Keys are removed with UNLINK in batches, so memory is reclaimed
+        by Redis in a background thread instead of blocking the server.
+
         Warning:
             Use with caution on large datasets!
             
@@ -337,14 +547,19 @@ class RedisCache:
             >>> await cache.clear_pattern("user:*")  # Delete all user keys
         """
         self._ensure_connected()
+        self._l1.clear()
         try:
-            keys = []
-            async for key in self._client.scan_iter(match=pattern):
-                keys.append(key)
-            
-            if keys:
-                return await self._client.delete(*keys)
-            return 0
+            deleted = 0
+            batch = []
+            async for key in self._client.scan_iter(match=pattern, count=SCAN_COUNT):
+                batch.append(key)
+                if len(batch) >= UNLINK_BATCH_SIZE:
+                    deleted += await self._client.unlink(*batch)
+                    batch = []
+
+            if batch:
+                deleted += await self._client.unlink(*batch)
+            return deleted
         except Exception as e:
             logger.error(f"Redis CLEAR PATTERN error for '{pattern}': {e}")
             return 0
@@ -374,6 +589,9 @@ class RedisCache:
     async def ping(self) -> bool:
         """
         Ping Redis server to check connection.
+
+        A successful ping is reused for PING_CACHE_SECONDS, so frequent
+        liveness probes don't each cost a round trip.
         
         Returns:
             True if server responds, False otherwise
@@ -383,8 +601,11 @@ class RedisCache:
             ...     print("Redis is alive")
         """
         self._ensure_connected()
+        if time.monotonic() - self._last_ping_ok < PING_CACHE_SECONDS:
+            return True
         try:
             await self._client.ping()
+            self._last_ping_ok = time.monotonic()
             return True
         except Exception as e:
             logger.error(f"Redis PING error: {e}")
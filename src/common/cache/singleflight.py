@@ -0,0 +1,55 @@
+"""
+Request coalescing ("single-flight") for async loaders.
+
+Concurrent calls for the same key share one in-flight coroutine instead of
+each hitting the backend, which prevents a cache stampede when a hot key
+expires.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Dict, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Deduplicate concurrent async calls by key.
+
+    Example usage:
+        >>> flight = SingleFlight()
+        >>> user = await flight.do("user:123", lambda: repo.get("123"))
+    """
+
+    def __init__(self) -> None:
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run fn() unless a call for the same key is already running,
+        in which case wait for and return its result.
+
+        Args:
+            key: Deduplication key
+            fn: Zero-argument callable returning an awaitable
+
+        Returns:
+            Result of the (possibly shared) call
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            # The call runs as its own task, so it belongs to no single caller:
+            # cancelling whichever caller started it doesn't affect the others
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        # Shield so a cancelled caller only stops waiting
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Future) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Mark as retrieved: there may be no callers left to observe it
+            task.exception()
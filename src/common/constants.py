@@ -0,0 +1,9 @@
+from typing import Final
+
+# Redis cache-aside for user configs
+USER_CACHE_KEY: Final[str] = "user:{}"
+USER_CACHE_TTL: Final[int] = 3600
+# Pre-encoded JSON response body for GET /user/{client_id}
+USER_WIRE_CACHE_KEY: Final[str] = "user_wire:{}"
+# Keys written per set_many call when warming the cache at startup
+PREFETCH_BATCH_SIZE: Final[int] = 500
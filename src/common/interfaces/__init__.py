@@ -1,8 +1,9 @@
-from src.common.interfaces.crud import AbstractMongoCRUDRepository
+from src.common.interfaces.crud import AbstractMongoCRUDRepository, Page
 from src.common.interfaces.repository import Repository
 
 
 __all__ = (
     "AbstractMongoCRUDRepository",
+    "Page",
     "Repository",
 )
@@ -1,11 +1,14 @@
 import abc
-from collections.abc import Mapping, Sequence
+from collections.abc import AsyncIterator, Iterable, Mapping, Sequence
 from typing import (
     Any,
     Generic,
+    List,
     Optional,
     Type,
+    TypedDict,
     TypeVar,
+    Union,
 )
 
 from src.common.interfaces.repository import Repository
@@ -15,6 +18,18 @@ EntryType = TypeVar("EntryType", bound=Mapping[str, Any])
 QueryType = TypeVar("QueryType", bound=Mapping[str, Any])
 
 
+class Page(TypedDict):
+    """
+    One page of a keyset-paginated query.
+
+    Pass `next_cursor` as `after` to fetch the next page; it is None when
+    there are no more documents. For sort keys other than `_id` it is a
+    [value, _id] pair, so documents sharing a value are not skipped.
+    """
+    items: List[Any]
+    next_cursor: Optional[Any]
+
+
 class AbstractMongoCRUDRepository(Repository, Generic[EntryType, QueryType]):
 
     model: Type[EntryType]
@@ -24,24 +39,77 @@ class AbstractMongoCRUDRepository(Repository, Generic[EntryType, QueryType]):
         self.model = model
 
     @abc.abstractmethod
-    async def create(self, **values: Mapping[str, Any]) -> Optional[EntryType]:
+    async def create(
+        self,
+        *,
+        refresh: bool = False,
+        raw: bool = False,
+        **values: Mapping[str, Any],
+    ) -> Optional[EntryType]:
 
         raise NotImplementedError
 
     @abc.abstractmethod
-    async def create_many(self, data: Sequence[Mapping[str, Any]]) -> Sequence[EntryType]:
+    async def create_many(
+        self,
+        data: Sequence[Mapping[str, Any]],
+        fast_insert: bool = False,
+        refresh: bool = False,
+        raw: bool = False,
+    ) -> Sequence[EntryType]:
 
         raise NotImplementedError
 
     @abc.abstractmethod
-    async def select(self, query: QueryType) -> Optional[EntryType]:
+    async def select(
+        self,
+        query: QueryType,
+        fields: Optional[Iterable[str]] = None,
+        raw: bool = False,
+        cacheable: bool = False,
+    ) -> Optional[EntryType]:
 
         raise NotImplementedError
 
     @abc.abstractmethod
     async def select_many(
-        self, query: QueryType, offset: Optional[int], limit: Optional[int]
-    ) -> Sequence[EntryType]:
+        self,
+        query: QueryType,
+        limit: Optional[int] = None,
+        after: Optional[Any] = None,
+        sort_key: str = "_id",
+        fields: Optional[Iterable[str]] = None,
+        raw: bool = False,
+    ) -> Page:
+
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def select_many_sorted(
+        self,
+        query: QueryType,
+        sort: Sequence[tuple[str, int]],
+        limit: Optional[int] = None,
+        raw: bool = False,
+    ) -> List[EntryType]:
+
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def explain(self, query: QueryType) -> Mapping[str, Any]:
+
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def iter_many(
+        self,
+        query: QueryType,
+        *,
+        batch_size: int = 500,
+        fields: Optional[Iterable[str]] = None,
+        sort_key: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[EntryType]:
 
         raise NotImplementedError
 
@@ -51,12 +119,22 @@ class AbstractMongoCRUDRepository(Repository, Generic[EntryType, QueryType]):
         raise NotImplementedError
 
     @abc.abstractmethod
-    async def update_many(self, data: Sequence[Mapping[str, Any]]) -> Any:
+    async def update_many(self, data: Sequence[Mapping[str, Any]], fast_update: bool = False) -> Any:
+
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def delete(self, query: QueryType, return_deleted: bool = False) -> Union[int, Sequence[Any]]:
+
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def delete_one(self, query: QueryType, raw: bool = False) -> Optional[EntryType]:
 
         raise NotImplementedError
 
     @abc.abstractmethod
-    async def delete(self, query: QueryType) -> Sequence[EntryType]:
+    async def create_indexes(self, indexes: Sequence[Any]) -> Sequence[str]:
 
         raise NotImplementedError
 
@@ -66,6 +144,6 @@ class AbstractMongoCRUDRepository(Repository, Generic[EntryType, QueryType]):
         raise NotImplementedError
 
     @abc.abstractmethod
-    async def count(self, query: QueryType) -> int:
+    async def count(self, query: QueryType, limit: Optional[int] = None) -> int:
 
         raise NotImplementedError
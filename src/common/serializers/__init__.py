@@ -1,3 +1,3 @@
-from .orjson_serializer import OrjsonSerializer
+from .orjson_serializer import OrjsonSerializer, dumps, loads
 
-__all__ = ["OrjsonSerializer"]
+__all__ = ["OrjsonSerializer", "dumps", "loads"]
@@ -3,10 +3,39 @@ OrJSON serializer for fast JSON encoding/decoding.
 
 OrJSON is significantly faster than standard json module
 and supports more Python types out of the box.
+
+Hot paths should use the module-level `dumps`/`loads` functions directly;
+`OrjsonSerializer` is kept as a thin wrapper around them.
 """
 
+import functools
+
 import orjson
 from typing import Any, Union
+from bson import ObjectId
+from pydantic import BaseModel
+
+
+# Options applied to every dumps() call (OPT_APPEND_NEWLINE deliberately off)
+_OPTS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_NAIVE_UTC
+
+
+def _default(obj: Any) -> Any:
+    """Fallback for types orjson doesn't know natively (pydantic models, ObjectId)."""
+    if isinstance(obj, ObjectId):
+        return str(obj)
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+# Serialize object to JSON bytes. A partial rather than a wrapper function,
+# so each call goes straight to orjson without an extra Python frame.
+dumps = functools.partial(orjson.dumps, default=_default, option=_OPTS)
+
+
+# orjson.loads accepts bytes, bytearray, memoryview and str natively
+loads = orjson.loads
 
 
 class OrjsonSerializer:
@@ -16,6 +45,8 @@ class OrjsonSerializer:
     Features:
     - 2-3x faster than standard json
     - Native support for datetime, UUID, dataclass, numpy types
+    - Pydantic models can be passed directly (no model_dump() needed)
+    - bson ObjectId is written as its hex string
     - Produces compact output
     - Thread-safe
     """
@@ -36,7 +67,7 @@ class OrjsonSerializer:
             >>> serializer.dumps({"hello": "world"})
             b'{"hello":"world"}'
         """
-        return orjson.dumps(obj)
+        return dumps(obj)
 
     @staticmethod
     def loads(data: Union[bytes, str]) -> Any:
@@ -74,4 +105,4 @@ class OrjsonSerializer:
             >>> serializer.dumps_str({"hello": "world"})
             '{"hello":"world"}'
         """
-        return orjson.dumps(obj).decode('utf-8')
+        return dumps(obj).decode('utf-8')
@@ -11,6 +11,12 @@ def run_api_uvicorn(app:Any, config: Settings, **kwargs: Any) -> Any:
         port=config.server.port,
         log_level=LOG_LEVEL.lower(),
         server_header=False,
+        # "auto" picks uvloop/httptools (uvicorn[standard]) and falls back to
+        # asyncio/h11 where they can't be installed
+        loop="auto",
+        http="auto",
+        interface="asgi3",
+        lifespan="on",
         **kwargs,
     )
     server = uvicorn.Server(uv_config)
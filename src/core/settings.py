@@ -1,22 +1,28 @@
 import os
+from functools import lru_cache
 from pathlib import Path
 from dotenv import find_dotenv, load_dotenv
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing import List, Optional, Final, Union
+from typing import List, Literal, Optional, Final, Union
 from pydantic import Field
 from enum import StrEnum
 
 
 
-#def load_env_if_not_docker():
+@lru_cache(maxsize=1)
+def _load_env_once() -> None:
+    """Load .env outside docker. Cached, so the file is located and parsed once."""
+    if not os.environ.get("DOCKER_CONTAINER"):
+        load_dotenv(find_dotenv(raise_error_if_not_found=True))
+
+
+_load_env_once()
+
 if not os.environ.get("DOCKER_CONTAINER"):
-    load_dotenv(find_dotenv(raise_error_if_not_found=True))
     BASE_WEB_HOOK_URL = os.environ.get("BASE_WEB_HOOK_URL")
 else:
     BASE_WEB_HOOK_URL = os.getenv("BASE_WEB_HOOK_URL_PROD")
 
-#load_env_if_not_docker()
-
 
 _PathLike = Union[os.PathLike[str], str, Path]
 
@@ -49,6 +55,7 @@ class ServerSettings(BaseSettings):
     origins: List[str] = ["*"]
     host: str = "127.0.0.1"
     port: int = 8080
+    runtime: Literal["uvicorn", "gunicorn"] = "uvicorn"
 
 
 class DatabaseSettings(BaseSettings):
@@ -66,7 +73,17 @@ class DatabaseSettings(BaseSettings):
     port: Optional[int] = None
     username: Optional[str] = None
     password: Optional[str] = None
-    connection_pool_size: int = 10
+    # Motor pool is per process: size it for peak concurrent requests of one
+    # worker so requests don't queue waiting for a free socket.
+    # Server-side connections to plan for:
+    #   total_server_conns = (min_pool_size + 2) * replica_members * workers
+    # (+2 are the driver's monitoring connections per server)
+    connection_pool_size: int = Field(
+        default_factory=lambda: max(100, (os.cpu_count() or 1) * 25)
+    )
+    min_pool_size: int = 10
+    wait_queue_timeout_ms: int = 2000
+    max_connecting: int = 4
     connection_max_overflow: int = 90
     connection_pool_pre_ping: bool = True
 
@@ -101,6 +118,9 @@ class RedisSettings(BaseSettings):
     host: str = "127.0.0.1"
     port: int = 6379
     password: Optional[str] = None
+    # Warm user configs into Redis at startup. Runs in every worker process;
+    # turn off (REDIS_PREFETCH_ON_STARTUP=false) when one worker is enough.
+    prefetch_on_startup: bool = True
 
 
 class Settings(BaseSettings):
@@ -109,11 +129,24 @@ class Settings(BaseSettings):
     redis: RedisSettings
 
 
+@lru_cache(maxsize=1)
+def _default_settings() -> Settings:
+    _load_env_once()
+    return Settings(
+        server=ServerSettings(),
+        db=DatabaseSettings(),
+        redis=RedisSettings()
+    )
+
+
 def load_settings(
         server: Optional[ServerSettings] = None,
         db: Optional[DatabaseSettings] = None,
         redis: Optional[RedisSettings] = None
 ) -> Settings:
+    # Settings models are not hashable, so only the default call is cached
+    if server is None and db is None and redis is None:
+        return _default_settings()
     return Settings(
         server=server or ServerSettings(),
         db=db or DatabaseSettings(),
@@ -1,4 +1,4 @@
-from typing import Any, Dict, TypeVar, Mapping
+from typing import Any, Dict, TypeVar
 from pydantic import BaseModel
 ModelType = TypeVar("ModelType", bound="Base", covariant=True)
 
@@ -21,19 +21,7 @@ class Base(BaseModel):
 
     def as_dict(self) -> Dict[str, Any]:
         """
-        Converts the object to a dictionary.  Handles nested Base objects and lists/tuples of Base objects.
+        Converts the object to a dictionary.  Nested models and lists/tuples of models
+        are handled by pydantic-core.
         """
-        result: Dict[str, Any] = {}
-        for attr, value in self.__dict__.items():
-            if attr.startswith("_"):
-                continue
-            if isinstance(value, Base):
-                result[attr] = value.as_dict()
-            elif isinstance(value, (list, tuple)):
-                result[attr] = type(value)(
-                    v.as_dict() if isinstance(v, Base) else v for v in value
-                )
-            else:
-                result[attr] = value
-
-        return result
\ No newline at end of file
+        return self.model_dump(mode="python")
@@ -1,9 +1,13 @@
-from typing import Optional
+from typing import Any, Optional
 
-from pydantic import BaseModel
+from bson import ObjectId
+from pydantic import AliasChoices, BaseModel, Field, field_serializer, field_validator
 
 
 class UserConfig(BaseModel):
+    # Mongo's _id. Instances built from documents with model_construct keep the
+    # ObjectId as-is; it is turned into a str only when serialized.
+    id: Optional[str] = Field(default=None, validation_alias=AliasChoices("_id", "id"))
     client_id: str = ""
     crm_url: str = ""
     crm_api_key: str = ""
@@ -11,3 +15,12 @@ class UserConfig(BaseModel):
     module_code: str = ""
     active: Optional[bool] = False
     freeze: Optional[bool] = False
+
+    @field_validator("id", mode="before")
+    @classmethod
+    def _validate_id(cls, value: Any) -> Any:
+        return str(value) if isinstance(value, ObjectId) else value
+
+    @field_serializer("id")
+    def _serialize_id(self, value: Any) -> Optional[str]:
+        return None if value is None else str(value)
@@ -1,15 +1,21 @@
-from typing import Generic, TypeVar, Type
+from typing import ClassVar, Generic, List, TypeVar, Type
+
+from pymongo import IndexModel
 
 from src.database.models.base import Base
 from src.database.repositories.crud import MongoDBCRUDRepository
 from src.database.repositories.types.repository import Repository
-from src.database.core.connection import MongoDBConnection
 from motor.core import AgnosticDatabase
 
 TypeModel = TypeVar("TypeModel", bound=Base)
 
 class BaseRepository(Repository, Generic[TypeModel]):
+    # Indexes the collection needs, created once at startup by ensure_indexes()
+    indexes: ClassVar[List[IndexModel]] = []
 
     def __init__(self, db: AgnosticDatabase) -> None:
         self._db = db
         self._crud = MongoDBCRUDRepository(self._db, self.collection_name, self.model)
+
+    async def ensure_indexes(self) -> None:
+        await self._crud.create_indexes(self.indexes)
@@ -1,99 +1,357 @@
-from collections.abc import Mapping, Sequence
+import copy
+from collections.abc import AsyncIterator, Iterable, Mapping, Sequence
+from hashlib import blake2b
 from typing import (
     Any,
+    Dict,
     Optional,
     Type,
     TypeVar,
+    Union,
 )
 
+import bson
+from bson import SON, ObjectId
+from cachetools import TTLCache
 from motor.core import AgnosticDatabase
+from pydantic import AliasChoices
+from pymongo import ASCENDING, IndexModel, UpdateMany, WriteConcern
 
-from src.common.interfaces import AbstractMongoCRUDRepository
+from src.common.interfaces import AbstractMongoCRUDRepository, Page
 
 
 DocumentType = TypeVar("DocumentType", bound=Mapping[str, Any])
 
 
+def stringify_ids(documents: Iterable[Mapping[str, Any]]) -> list[dict]:
+    """
+    Copy documents with `_id` converted to str.
+
+    Reads return `_id` as ObjectId; the JSON serializers convert it on output,
+    so only use this when a str is needed before serialization.
+    """
+    return [{**document, "_id": str(document["_id"])} for document in documents]
+
+
+# Query/update skeletons shared by every call site, so each operation always
+# sends the same shape and the server's plan cache keeps matching it
+def _set(update: Mapping[str, Any]) -> dict:
+    return {"$set": update}
+
+
+def _by_ids(ids: Sequence[Any]) -> dict:
+    return {"_id": {"$in": ids}}
+
+
+def _document_key(name: str, field: Any) -> str:
+    # Document key a model field is read from, e.g. "_id" for
+    # id = Field(validation_alias=AliasChoices("_id", "id"))
+    alias = field.validation_alias
+    if isinstance(alias, AliasChoices):
+        alias = alias.choices[0]
+    if isinstance(alias, str):
+        return alias
+    return field.alias or name
+
+
+def _canonical_bson_hash(query: Mapping[str, Any]) -> bytes:
+    # Top-level keys are sorted so {"a": 1, "b": 2} and {"b": 2, "a": 1} share an entry
+    return blake2b(bson.encode(SON(sorted(query.items()))), digest_size=16).digest()
+
+
 class MongoDBCRUDRepository(AbstractMongoCRUDRepository[DocumentType, dict]):
+    """
+    CRUD operations over one MongoDB collection.
+
+    Reads go through find() (filter, sort, limit). Don't add aggregate()-based
+    helpers for queries find() can express: a pipeline only uses an index when
+    $match is its first stage and costs extra planning and server memory. Any
+    aggregate() call here needs a comment saying why find() can't do it.
+    """
 
     def __init__(self, db: AgnosticDatabase, collection_name: str, model: Type[DocumentType]) -> None:
         super().__init__(model)
         self._db = db
         self._collection_name = collection_name
         self._collection = self._db[self._collection_name]  # Cache the collection object
-
-    async def create(self, **values: Any) -> Optional[DocumentType]:
-
-        result = await self._collection.insert_one(values)
-        if result.inserted_id:
-            # Retrieve the newly created document
-            document = await self.select({"_id": result.inserted_id})
-            document["_id"] = str(document["_id"])
+        # Unacknowledged (w=0) view for fast_insert/fast_update: the driver
+        # doesn't wait for the server, so failures and counts are not reported.
+        # Only for data that may be lost (metrics, logs).
+        self._unack_collection = self._collection.with_options(write_concern=WriteConcern(w=0))
+        # Fetch only the fields the model declares (None = whole document)
+        model_fields = getattr(model, "model_fields", None)
+        self._projection = (
+            {_document_key(name, field): 1 for name, field in model_fields.items()} if model_fields else None
+        )
+        # Documents come from our own collection, so build models without
+        # re-running validation. Plain mapping types are returned as-is.
+        self._construct = getattr(model, "model_construct", None)
+        # Opt-in results of select(cacheable=True). Cleared on every write made
+        # through this repository; writes from elsewhere show up within the TTL.
+        self._read_cache: TTLCache = TTLCache(maxsize=4096, ttl=30)
+
+    def _to_entry(self, document: Mapping[str, Any], fields: Optional[Iterable[str]], raw: bool) -> Any:
+
+        # A projected document would get defaults for the missing fields, so
+        # only full reads are turned into models
+        if raw or fields is not None or self._construct is None:
             return document
+        return self._construct(**document)
 
-        return None
+    def _get_projection(self, fields: Optional[Iterable[str]]) -> Optional[Dict[str, int]]:
 
-    async def create_many(self, data: Sequence[Mapping[str, Any]]) -> Sequence[DocumentType]:
+        if fields is None:
+            return self._projection
+        return {field: 1 for field in fields}
 
-        result = await self._collection.insert_many(data)
-        return await self.select_many({"_id": {"$in": result.inserted_ids}})
+    async def create(self, *, refresh: bool = False, raw: bool = False, **values: Any) -> Optional[DocumentType]:
 
-    async def select(self, query: dict) -> Optional[DocumentType]:
-        document = await self._collection.find_one(query)
-        if document:
-            document["_id"] = str(document["_id"])
-            return document
-        return None
-
-    async def select_many(
-        self, query: dict, offset: Optional[int] = None, limit: Optional[int] = None
+        result = await self._collection.insert_one(values)
+        self._read_cache.clear()
+        if result.inserted_id is None:
+            return None
+        # The inserted body is already known, so the result is built locally.
+        # "_id" stays an ObjectId; serializers stringify it on output.
+        document = {**values, "_id": result.inserted_id}
+        if refresh:
+            # Re-read only when the caller needs server-computed fields. Falls
+            # back to the local document if the read doesn't see the insert yet
+            # (e.g. a lagging secondary).
+            stored = await self.select({"_id": result.inserted_id}, raw=True)
+            if stored is not None:
+                document = stored
+        return self._to_entry(document, None, raw)
+
+    async def create_many(
+        self,
+        data: Sequence[Mapping[str, Any]],
+        fast_insert: bool = False,
+        refresh: bool = False,
+        raw: bool = False,
     ) -> Sequence[DocumentType]:
 
+        documents = list(data)
+        if not documents:
+            return []
+        self._read_cache.clear()
+        if fast_insert:
+            # No inserted_ids from the server; "_id" values are the ones the
+            # driver generated client-side
+            await self._unack_collection.insert_many(documents, ordered=False)
+            return [self._to_entry(document, None, raw) for document in documents]
+
+        # One insert command for the whole batch; unordered lets the server
+        # keep going past a failed document instead of stopping the batch
+        result = await self._collection.insert_many(documents, ordered=False)
+        if refresh:
+            page = await self.select_many(_by_ids(result.inserted_ids), raw=raw)
+            return page["items"]
+        # insert_many has set "_id" on each document
+        return [self._to_entry(document, None, raw) for document in documents]
+
+    async def select(
+        self,
+        query: dict,
+        fields: Optional[Iterable[str]] = None,
+        raw: bool = False,
+        cacheable: bool = False,
+    ) -> Optional[DocumentType]:
+
+        # Returns a model instance, like every method returning documents;
+        # raw=True returns the document dict.
+        # cacheable=True serves repeated queries from the in-process read cache.
+        key = None
+        if cacheable:
+            projection_key = None if fields is None else tuple(sorted(fields))
+            key = (self._collection_name, _canonical_bson_hash(query), projection_key)
+            document = self._read_cache.get(key)
+            if document is not None:
+                # Callers may mutate what they get back
+                return self._to_entry(copy.copy(document), fields, raw)
+
+        document = await self._collection.find_one(query, self._get_projection(fields))
+        if document is None:
+            return None
+        if key is not None:
+            self._read_cache[key] = document
+            document = copy.copy(document)
+        return self._to_entry(document, fields, raw)
 
-        cursor = self._collection.find(query)
-        if offset is not None:
-            cursor = cursor.skip(offset)
+    async def select_many(
+        self,
+        query: dict,
+        limit: Optional[int] = None,
+        after: Optional[Any] = None,
+        sort_key: str = "_id",
+        fields: Optional[Iterable[str]] = None,
+        raw: bool = False,
+    ) -> Page:
+
+        # Keyset pagination: the index seeks straight past the last seen key,
+        # so deep pages cost the same as the first one (unlike skip()).
+        # Other sort keys may repeat, so _id breaks ties and the cursor is the
+        # [value, _id] pair; index (sort_key, _id) to keep it a seek. A missing
+        # sort field counts as null, which Mongo sorts first. Comparisons only
+        # match values of the same BSON type, so keep sort_key values one type.
+        if after is not None:
+            if sort_key == "_id":
+                if isinstance(after, str):
+                    after = ObjectId(after)
+                bound = {"_id": {"$gt": after}}
+                query = {"$and": [query, bound]} if "_id" in query else {**query, **bound}
+            else:
+                after_value, after_id = after
+                if isinstance(after_id, str):
+                    after_id = ObjectId(after_id)
+                # {"$gt": None} matches nothing, so past null is "any non-null"
+                greater = {"$ne": None} if after_value is None else {"$gt": after_value}
+                bound = {
+                    "$or": [
+                        {sort_key: greater},
+                        {sort_key: after_value, "_id": {"$gt": after_id}},
+                    ]
+                }
+                query = {"$and": [query, bound]}
+
+        documents = [
+            document
+            async for document in self.iter_many(query, fields=fields, sort_key=sort_key, limit=limit)
+        ]
+        next_cursor = None
+        if documents and limit is not None and len(documents) == limit:
+            last = documents[-1]
+            if sort_key == "_id":
+                next_cursor = str(last["_id"])
+            else:
+                next_cursor = [last.get(sort_key), str(last["_id"])]
+        items = [self._to_entry(document, fields, raw) for document in documents]
+        return {"items": items, "next_cursor": next_cursor}
+
+    async def select_many_sorted(
+        self,
+        query: dict,
+        sort: Sequence[tuple[str, int]],
+        limit: Optional[int] = None,
+        raw: bool = False,
+    ) -> list:
+
+        # Plain find().sort().limit(); with an index on the sort keys the
+        # server walks it in order and stops after `limit` documents
+        cursor = self._collection.find(query, self._projection).sort(list(sort))
+        if limit is not None:
+            cursor = cursor.limit(limit)
+        return [self._to_entry(document, None, raw) async for document in cursor]
+
+    async def explain(self, query: dict) -> dict:
+
+        # Query plan as select/select_many would run it; look for IXSCAN
+        # (index used) rather than COLLSCAN in queryPlanner.winningPlan
+        return await self._collection.find(query, self._projection).explain()
+
+    async def iter_many(
+        self,
+        query: dict,
+        *,
+        batch_size: int = 500,
+        fields: Optional[Iterable[str]] = None,
+        sort_key: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[DocumentType]:
+
+        # Yields raw documents, one server batch at a time instead of buffering
+        # the whole result set, so memory stays at roughly one batch
+        projection = self._get_projection(fields)
+        if projection is not None and sort_key is not None and sort_key not in projection:
+            # Callers paginating by sort_key read it from the documents
+            projection = {**projection, sort_key: 1}
+
+        cursor = self._collection.find(query, projection).batch_size(batch_size)
+        if sort_key is not None:
+            # _id as tiebreaker gives equal sort values a stable order
+            sort = [(sort_key, ASCENDING)]
+            if sort_key != "_id":
+                sort.append(("_id", ASCENDING))
+            cursor = cursor.sort(sort)
         if limit is not None:
             cursor = cursor.limit(limit)
 
-        documents = await cursor.to_list(length=None) # Fetch all documents within the limit/offset
-        return documents
+        async for document in cursor:
+            yield document
 
     async def update(self, query: dict, update: dict) -> Sequence[DocumentType]:
 
 
-        result = await self._collection.update_one(query, {"$set": update})
+        result = await self._collection.update_one(query, _set(update))
+        self._read_cache.clear()
         return await self.select(query)
 
 
-    async def update_many(self, data: Sequence[Mapping[str, Any]]) -> Any:
-
-        modified_count = 0
-        for item in data:
-            query = item.get("query")
-            update = item.get("update")
-            if query and update:
-                result = await self._collection.update_many(query, {"$set": update})
-                modified_count += result.modified_count
-        return modified_count  # Return the total number of modified documents
-
-
-    async def delete(self, query: dict) -> Sequence[DocumentType]:
-
-
-        # MongoDB doesn't directly return the deleted documents. We fetch them before deleting.
-        deleted_documents = await self.select_many(query)
-        result = await self._collection.delete_many(query)
-        return deleted_documents
+    async def update_many(self, data: Sequence[Mapping[str, Any]], fast_update: bool = False) -> Any:
+
+        # A single bulk_write round trip instead of one update_many per item
+        operations = [
+            UpdateMany(item["query"], _set(item["update"]))
+            for item in data
+            if item.get("query") and item.get("update")
+        ]
+        if not operations:
+            return 0
+        if fast_update:
+            # Unacknowledged: the modified count is unknown, report 0
+            await self._unack_collection.bulk_write(operations, ordered=False)
+            self._read_cache.clear()
+            return 0
+        result = await self._collection.bulk_write(operations, ordered=False)
+        self._read_cache.clear()
+        return result.modified_count  # Return the total number of modified documents
+
+
+    async def delete(self, query: dict, return_deleted: bool = False) -> Union[int, Sequence[Any]]:
+
+        self._read_cache.clear()
+        if not return_deleted:
+            result = await self._collection.delete_many(query)
+            return result.deleted_count
+
+        # MongoDB doesn't return deleted documents. Pre-read only their ids
+        # and delete exactly those, so memory stays bounded to the id list.
+        ids = [document["_id"] async for document in self._collection.find(query, {"_id": 1})]
+        if ids:
+            await self._collection.delete_many(_by_ids(ids))
+        return ids
+
+    async def delete_one(self, query: dict, raw: bool = False) -> Optional[DocumentType]:
+
+        # Atomic read + delete in one round trip
+        self._read_cache.clear()
+        document = await self._collection.find_one_and_delete(query)
+        if document is None:
+            return None
+        return self._to_entry(document, None, raw)
 
     async def exists(self, query: dict) -> bool:
 
         count = await self._collection.count_documents(query, limit=1)
         return count > 0
 
-    async def count(self, query: dict) -> int:
+    async def count(self, query: dict, limit: Optional[int] = None) -> int:
+
+        if not query:
+            # O(1) read of collection metadata instead of an index scan.
+            # May be slightly off after an unclean shutdown.
+            total = await self._collection.estimated_document_count()
+            return total if limit is None else min(total, limit)
+        if limit is None:
+            return await self._collection.count_documents(query)
+        # Stops scanning once `limit` matches are found
+        return await self._collection.count_documents(query, limit=limit)
+
+    async def create_indexes(self, indexes: Sequence[IndexModel]) -> Sequence[str]:
 
-        return await self._collection.count_documents(query)
+        # createIndexes is idempotent and builds all indexes in one command
+        if not indexes:
+            return []
+        return await self._collection.create_indexes(list(indexes))
 
     def with_query_model(self, model: Type[DocumentType]) -> "MongoDBCRUDRepository[DocumentType]":
 
@@ -1,22 +1,37 @@
+from collections.abc import AsyncIterator, Iterable, Sequence
 from typing import Optional
+from pymongo import ASCENDING, IndexModel
 from src.database.repositories import BaseRepository
 import src.database.models as models
 
 
+def by_client_id(client: str) -> dict:
+    # The one query shape for client_id lookups (plain equality, never
+    # {"$eq": ...}), so they all share one cached plan on uniq_client_id
+    return {"client_id": client}
+
+
+def _to_document(user: models.UserConfig) -> dict:
+    # mode="python" skips the JSON coercion pass. exclude_unset is deliberately
+    # not used: it would drop defaulted fields (active, freeze) from the document.
+    # "id" is Mongo's _id, assigned on insert.
+    return user.model_dump(mode="python", exclude_none=True, exclude={"id"})
+
 
 class UserRepository(BaseRepository[models.UserConfig]):
     model = models.UserConfig
     collection_name = 'users'
+    indexes = [IndexModel([("client_id", ASCENDING)], unique=True, name="uniq_client_id")]
 
     async def get_by_client_id(self, client: str) -> Optional[models.UserConfig]:
-        result = await self._crud.select({"client_id": client})
-        return result
-
-    async def create(self, user: models.UserConfig) -> models.UserConfig:
-        result = await self._crud.create(**user.model_dump(exclude_none=True))
-        return result
-
-
+        return await self._crud.select(by_client_id(client))
 
+    def iter_active(self) -> AsyncIterator[dict]:
+        return self._crud.iter_many({"active": True})
 
+    async def create(self, user: models.UserConfig) -> Optional[models.UserConfig]:
+        return await self._crud.create(**_to_document(user))
 
+    async def create_many_models(self, users: Iterable[models.UserConfig]) -> Sequence[models.UserConfig]:
+        # One insert_many for the whole batch
+        return await self._crud.create_many([_to_document(user) for user in users])
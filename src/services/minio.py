@@ -1,5 +1,53 @@
 import asyncio
+from typing import Any
+
 import aioboto3
+from boto3.s3.transfer import TransferConfig
+from botocore.exceptions import ClientError
+
+from src.core.logger import logger
+
+# (endpoint, бакет), существование которых уже проверено в этом процессе
+_known_buckets: set[tuple[str, str]] = set()
+
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=8,
+    use_threads=False,
+)
+
+# Один клиент на (endpoint, access key): соединения и TLS-сессии
+# переиспользуются между загрузками. Клиенты живут до close_s3.
+_session = aioboto3.Session()
+_clients: dict[tuple[str, str], tuple[Any, Any]] = {}
+_lock = asyncio.Lock()
+
+
+async def get_s3(endpoint_url: str, access_key: str, secret_key: str):
+    key = (endpoint_url, access_key)
+    async with _lock:
+        entry = _clients.get(key)
+        if entry is None:
+            client_cm = _session.client(
+                's3',
+                endpoint_url=endpoint_url,
+                aws_access_key_id=access_key,
+                aws_secret_access_key=secret_key,
+                region_name='us-east-1',  # MinIO не требует региона, но boto3 требует указать
+            )
+            entry = (client_cm, await client_cm.__aenter__())
+            _clients[key] = entry
+        return entry[1]
+
+
+async def close_s3() -> None:
+    async with _lock:
+        for client_cm, _ in _clients.values():
+            await client_cm.__aexit__(None, None, None)
+        _clients.clear()
+        _known_buckets.clear()
+
 
 async def upload_file_to_minio(
     endpoint_url: str,
@@ -9,28 +57,23 @@ async def upload_file_to_minio(
     file_path: str,
     object_name: str
 ):
-    session = aioboto3.Session()
-    async with session.client(
-        's3',
-        endpoint_url=endpoint_url,
-        aws_access_key_id=access_key,
-        aws_secret_access_key=secret_key,
-        region_name='us-east-1',  # MinIO не требует региона, но boto3 требует указать
-    ) as s3_client:
-
-        # Проверяем, существует ли бакет
-        buckets = await s3_client.list_buckets()
-        bucket_names = [b['Name'] for b in buckets.get('Buckets', [])]
-        if bucket_name not in bucket_names:
+    s3_client = await get_s3(endpoint_url, access_key, secret_key)
+
+    # Проверяем бакет только один раз за процесс: head_bucket вместо list_buckets
+    if (endpoint_url, bucket_name) not in _known_buckets:
+        try:
+            await s3_client.head_bucket(Bucket=bucket_name)
+            logger.debug("Бакет %s уже существует", bucket_name)
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") not in ("404", "NoSuchBucket"):
+                raise
             await s3_client.create_bucket(Bucket=bucket_name)
-            print(f"Создан бакет: {bucket_name}")
-        else:
-            print(f"Бакет {bucket_name} уже существует")
+            logger.info("Создан бакет: %s", bucket_name)
+        _known_buckets.add((endpoint_url, bucket_name))
 
-        # Загружаем файл
-        with open(file_path, 'rb') as file_data:
-            await s3_client.put_object(Bucket=bucket_name, Key=object_name, Body=file_data)
-            print(f"Файл '{file_path}' успешно загружен в '{bucket_name}/{object_name}'")
+    # Загружаем файл частями (multipart), не читая его целиком в память
+    await s3_client.upload_file(file_path, bucket_name, object_name, Config=TRANSFER_CONFIG)
+    logger.debug("Файл '%s' успешно загружен в '%s/%s'", file_path, bucket_name, object_name)
 
 if __name__ == "__main__":
     MINIO_ENDPOINT = "https://minio.radis.pro"  # Обязательно с http:// или https://
@@ -40,11 +83,17 @@ if __name__ == "__main__":
     FILE_PATH = "path/to/local/file.txt"
     OBJECT_NAME = "file.txt"
 
-    asyncio.run(upload_file_to_minio(
-        MINIO_ENDPOINT,
-        MINIO_ACCESS_KEY,
-        MINIO_SECRET_KEY,
-        BUCKET_NAME,
-        FILE_PATH,
-        OBJECT_NAME
-    ))
+    async def _main():
+        try:
+            await upload_file_to_minio(
+                MINIO_ENDPOINT,
+                MINIO_ACCESS_KEY,
+                MINIO_SECRET_KEY,
+                BUCKET_NAME,
+                FILE_PATH,
+                OBJECT_NAME
+            )
+        finally:
+            await close_s3()
+
+    asyncio.run(_main())
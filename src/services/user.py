@@ -1,17 +1,86 @@
+from typing import Optional
+
+from pymongo.errors import DuplicateKeyError
 from src.services import Service
 from src.database.repositories.user import UserRepository
+from src.common.cache import RedisCache, SingleFlight
+from src.common.constants import USER_CACHE_KEY, USER_CACHE_TTL, USER_WIRE_CACHE_KEY, PREFETCH_BATCH_SIZE
+from src.common.serializers import dumps
+from src.database.models import UserConfig
+
 
+class UserAlreadyExistsError(Exception):
+    """A user with this client_id already exists."""
 
 
 class UserService(Service[UserRepository]):
 
-    def __init__(self, db):
-        self._repo = UserRepository(db)
+    def __init__(self, repository: UserRepository, cache: RedisCache):
+        super().__init__(repository)
+        self._cache = cache
+        self._inflight = SingleFlight()
+
+    async def get_user(self, user_id: str) -> Optional[UserConfig]:
+        key = USER_CACHE_KEY.format(user_id)
+        cached = await self._cache.get(key)
+        if cached is not None:
+            # Cached from our own writes, no need to validate again
+            return UserConfig.model_construct(**cached)
+        # Concurrent misses for the same user share one Mongo query
+        result = await self._inflight.do(user_id, lambda: self._load_user(user_id, key))
+        return result
+
+    async def get_user_wire(self, user_id: str) -> Optional[bytes]:
+        """
+        Get the user config as a ready-to-send JSON body.
+
+        The encoded response is cached, so a hit skips serialization entirely.
+        """
+        key = USER_WIRE_CACHE_KEY.format(user_id)
+        raw = await self._cache.get_raw(key)
+        if raw is not None:
+            return raw
+        user = await self.get_user(user_id)
+        if user is None:
+            return None
+        raw = dumps(user)
+        await self._cache.set_raw(key, raw, ttl=USER_CACHE_TTL)
+        return raw
 
-    async def get_user(self, user_id):
+    async def _load_user(self, user_id: str, key: str) -> Optional[UserConfig]:
         result = await self._repo.get_by_client_id(user_id)
+        if result is not None:
+            await self._cache.set(key, result, ttl=USER_CACHE_TTL)
         return result
 
-    async def create(self, user):
-        result = await self._repo.create(user)
+    async def create(self, user: UserConfig) -> Optional[UserConfig]:
+        try:
+            result = await self._repo.create(user)
+        except DuplicateKeyError as e:
+            raise UserAlreadyExistsError(user.client_id) from e
+        if result is not None:
+            # Write-through so the next read doesn't go to Mongo
+            await self._cache.set(USER_CACHE_KEY.format(result.client_id), result, ttl=USER_CACHE_TTL)
+            await self._cache.delete(USER_WIRE_CACHE_KEY.format(result.client_id))
         return result
+
+    async def prefetch_user_configs(self) -> int:
+        """
+        Warm Redis with all active user configs.
+
+        Returns:
+            Number of configs written to the cache
+        """
+        count = 0
+        batch = {}
+        async for doc in self._repo.iter_active():
+            # Same shape _load_user() and create() cache: the model's dump
+            batch[USER_CACHE_KEY.format(doc["client_id"])] = UserConfig.model_construct(**doc)
+            if len(batch) >= PREFETCH_BATCH_SIZE:
+                await self._cache.set_many(batch, ttl=USER_CACHE_TTL)
+                count += len(batch)
+                batch = {}
+        if batch:
+            await self._cache.set_many(batch, ttl=USER_CACHE_TTL)
+            count += len(batch)
+        return count
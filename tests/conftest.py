@@ -0,0 +1,4 @@
+import os
+
+# Settings require a .env file unless running in docker; tests don't need one
+os.environ.setdefault("DOCKER_CONTAINER", "1")
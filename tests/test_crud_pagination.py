@@ -0,0 +1,89 @@
+import asyncio
+
+from bson import ObjectId
+from mongomock_motor import AsyncMongoMockClient
+
+from src.database.models import UserConfig
+from src.database.repositories.crud import MongoDBCRUDRepository
+
+
+def _repository() -> MongoDBCRUDRepository:
+    return MongoDBCRUDRepository(AsyncMongoMockClient()["test"], "users", UserConfig)
+
+
+async def _collect(repo, limit, sort_key="_id", cursor=lambda page: page["next_cursor"]):
+    seen, after = [], None
+    while True:
+        page = await repo.select_many({}, limit=limit, after=after, sort_key=sort_key)
+        seen.extend(user.client_id for user in page["items"])
+        after = cursor(page)
+        if after is None:
+            return seen
+
+
+def test_pages_by_id_in_insertion_order():
+    async def scenario():
+        repo = _repository()
+        await repo.create_many([{"client_id": str(i)} for i in range(7)])
+        return await _collect(repo, limit=3)
+
+    assert asyncio.run(scenario()) == [str(i) for i in range(7)]
+
+
+def test_string_id_cursor_is_turned_back_into_object_id():
+    async def scenario():
+        repo = _repository()
+        await repo.create_many([{"client_id": str(i)} for i in range(4)])
+        first = await repo.select_many({}, limit=2)
+        assert isinstance(first["next_cursor"], str)
+        assert ObjectId.is_valid(first["next_cursor"])
+        second = await repo.select_many({}, limit=2, after=first["next_cursor"])
+        return [user.client_id for user in second["items"]]
+
+    assert asyncio.run(scenario()) == ["2", "3"]
+
+
+def test_ties_on_non_id_sort_key_are_not_skipped():
+    async def scenario():
+        repo = _repository()
+        # Three documents share each module_code, so page bounds fall inside ties
+        await repo.create_many(
+            [{"client_id": str(i), "module_code": str(i // 3)} for i in range(10)]
+        )
+        return await _collect(repo, limit=2, sort_key="module_code")
+
+    assert asyncio.run(scenario()) == [str(i) for i in range(10)]
+
+
+def test_missing_sort_field_sorts_first_and_pages_through():
+    async def scenario():
+        repo = _repository()
+        await repo.create_many(
+            [{"client_id": "a"}, {"client_id": "b", "module_code": "x"}, {"client_id": "c"}]
+        )
+        first = await repo.select_many({}, limit=2, sort_key="module_code")
+        rest = await _collect(repo, limit=2, sort_key="module_code")
+        return first["next_cursor"][0], rest
+
+    cursor_value, seen = asyncio.run(scenario())
+    assert cursor_value is None
+    assert seen == ["a", "c", "b"]
+
+
+def test_last_page_has_no_cursor():
+    async def scenario():
+        repo = _repository()
+        await repo.create_many([{"client_id": str(i)} for i in range(5)])
+        full = await repo.select_many({}, limit=5)
+        fourth = (await repo.select_many({}, limit=4))["next_cursor"]
+        partial = await repo.select_many({}, limit=2, after=fourth)
+        unlimited = await repo.select_many({})
+        return full, partial, unlimited
+
+    full, partial, unlimited = asyncio.run(scenario())
+    # A full page can't know there is nothing after it; the next one is empty
+    assert full["next_cursor"] is not None
+    assert [user.client_id for user in partial["items"]] == ["4"]
+    assert partial["next_cursor"] is None
+    assert len(unlimited["items"]) == 5
+    assert unlimited["next_cursor"] is None
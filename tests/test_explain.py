@@ -0,0 +1,59 @@
+import asyncio
+import os
+import uuid
+
+import pytest
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo.errors import PyMongoError
+
+from src.database.repositories.user import UserRepository, by_client_id
+
+MONGO_TEST_URI = os.environ.get("MONGO_TEST_URI", "mongodb://localhost:27017")
+
+
+def _mongo_available() -> bool:
+    async def ping() -> None:
+        client = AsyncIOMotorClient(MONGO_TEST_URI, serverSelectionTimeoutMS=500)
+        try:
+            await client.admin.command("ping")
+        finally:
+            client.close()
+
+    try:
+        asyncio.run(ping())
+    except PyMongoError:
+        return False
+    return True
+
+
+pytestmark = pytest.mark.skipif(not _mongo_available(), reason=f"no MongoDB at {MONGO_TEST_URI}")
+
+
+def _index_scans(plan):
+    # Plan shapes differ between query engines, so walk the whole tree
+    if isinstance(plan, dict):
+        if plan.get("stage") == "IXSCAN":
+            yield plan
+        for value in plan.values():
+            yield from _index_scans(value)
+    elif isinstance(plan, list):
+        for value in plan:
+            yield from _index_scans(value)
+
+
+def test_get_by_client_id_uses_unique_index():
+    async def scenario():
+        client = AsyncIOMotorClient(MONGO_TEST_URI)
+        db = client[f"test_explain_{uuid.uuid4().hex}"]
+        try:
+            repo = UserRepository(db)
+            await repo.ensure_indexes()
+            await db[repo.collection_name].insert_many([{"client_id": str(i)} for i in range(50)])
+            return await repo._crud.explain(by_client_id("7"))
+        finally:
+            await client.drop_database(db.name)
+            client.close()
+
+    plan = asyncio.run(scenario())
+    scans = list(_index_scans(plan["queryPlanner"]["winningPlan"]))
+    assert [scan["indexName"] for scan in scans] == ["uniq_client_id"]
@@ -0,0 +1,68 @@
+import asyncio
+
+import pytest
+
+from src.common.cache.singleflight import SingleFlight
+
+
+def test_concurrent_calls_share_one_execution():
+    async def scenario():
+        flight = SingleFlight()
+        calls = 0
+
+        async def load():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "value"
+
+        results = await asyncio.gather(*(flight.do("key", load) for _ in range(5)))
+        return calls, results
+
+    calls, results = asyncio.run(scenario())
+    assert calls == 1
+    assert results == ["value"] * 5
+
+
+def test_cancelled_leader_does_not_cancel_waiters():
+    async def scenario():
+        flight = SingleFlight()
+        started = asyncio.Event()
+
+        async def load():
+            started.set()
+            await asyncio.sleep(0.01)
+            return "value"
+
+        leader = asyncio.create_task(flight.do("key", load))
+        await started.wait()
+        waiter = asyncio.create_task(flight.do("key", load))
+        await asyncio.sleep(0)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await waiter
+
+    assert asyncio.run(scenario()) == "value"
+
+
+def test_error_is_shared_and_key_is_released():
+    async def scenario():
+        flight = SingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            flight.do("key", fail), flight.do("key", fail), return_exceptions=True
+        )
+
+        async def load():
+            return "value"
+
+        return results, await flight.do("key", load)
+
+    results, retried = asyncio.run(scenario())
+    assert all(isinstance(result, ValueError) for result in results)
+    assert retried == "value"